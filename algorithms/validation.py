@@ -0,0 +1,111 @@
+def validate_schedule(schedule, processes, max_errors=10):
+    """
+    Check that a schedule is a valid single-CPU execution of the processes.
+
+    Segments may be listed in any order. Schedules already in time order, as
+    every scheduling algorithm produces them, are checked in a single linear
+    pass; any other order is sorted by start time first, at O(n log n).
+    Segment indices in the messages always refer to the original list.
+
+    A schedule is valid when:
+      - the processes have unique pids
+      - every segment belongs to a known process and has end >= start
+      - no segment starts before its process arrives
+      - no segment overlaps an earlier one
+      - the total time each process runs equals its burst
+
+    Args:
+        schedule: List of tuples (pid, start_time, end_time)
+        processes: List of dictionaries with process details
+        max_errors: Stop after this many violations (None for no limit)
+
+    Returns:
+        List of human-readable violations; empty when the schedule is valid
+    """
+    errors = []
+    process_dict = {}
+    for process in processes:
+        if process['pid'] in process_dict:
+            errors.append(f"duplicate pid {process['pid']} in processes")
+        process_dict[process['pid']] = process
+    if errors:
+        # Per-pid totals are meaningless when pids are ambiguous
+        return errors[:max_errors] if max_errors is not None else errors
+
+    executed = dict.fromkeys(process_dict, 0)
+    busy_until = None
+
+    segments = enumerate(schedule)
+    if any(schedule[i][1] > schedule[i + 1][1] for i in range(len(schedule) - 1)):
+        segments = sorted(segments, key=lambda item: item[1][1])
+
+    for index, (pid, start, end) in segments:
+        if max_errors is not None and len(errors) >= max_errors:
+            return errors
+
+        process = process_dict.get(pid)
+        if process is None:
+            errors.append(f"segment {index}: unknown pid {pid}")
+            continue
+        if end < start:
+            errors.append(f"segment {index}: pid {pid} ends at {end} before it starts at {start}")
+        if start < process['arrival']:
+            errors.append(f"segment {index}: pid {pid} runs at {start} before arriving at {process['arrival']}")
+        if busy_until is not None and start < busy_until:
+            errors.append(f"segment {index}: pid {pid} starts at {start} while the CPU is busy until {busy_until}")
+
+        executed[pid] += end - start
+        if busy_until is None or end > busy_until:
+            busy_until = end
+
+    for pid, process in process_dict.items():
+        if max_errors is not None and len(errors) >= max_errors:
+            break
+        if executed[pid] != process['burst']:
+            errors.append(f"pid {pid}: ran for {executed[pid]} but burst is {process['burst']}")
+
+    return errors
+
+
+def normalize_schedule(schedule):
+    """
+    Merge back-to-back segments of the same process and drop empty ones, so
+    schedules that only differ in how they split a continuous run compare equal.
+    """
+    normalized = []
+    for pid, start, end in schedule:
+        if end == start:
+            continue
+        if normalized and normalized[-1][0] == pid and normalized[-1][2] == start:
+            normalized[-1] = (pid, normalized[-1][1], end)
+        else:
+            normalized.append((pid, start, end))
+    return normalized
+
+
+def first_divergence(expected, actual, normalize=True):
+    """
+    Find the first segment where two schedules differ.
+
+    Args:
+        expected: Schedule from the reference engine
+        actual: Schedule from the engine under test
+        normalize: Compare normalized schedules (see normalize_schedule)
+
+    Returns:
+        None if the schedules match, otherwise a tuple (index, expected_segment,
+        actual_segment) where a segment is None if that schedule ended early
+    """
+    if normalize:
+        expected, actual = normalize_schedule(expected), normalize_schedule(actual)
+
+    for index, (left, right) in enumerate(zip(expected, actual)):
+        if tuple(left) != tuple(right):
+            return index, tuple(left), tuple(right)
+
+    if len(expected) != len(actual):
+        index = min(len(expected), len(actual))
+        return (index,
+                tuple(expected[index]) if index < len(expected) else None,
+                tuple(actual[index]) if index < len(actual) else None)
+    return None
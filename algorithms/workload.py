@@ -0,0 +1,76 @@
+import numpy as np
+
+BURST_DISTRIBUTIONS = ("exponential", "lognormal", "uniform")
+
+
+def generate_workload_batch(n_sets, n_processes, seed=None, arrival_rate=0.15,
+                            mean_burst=5.0, burst_distribution="exponential",
+                            burst_sigma=0.75, priority_levels=5):
+    """
+    Generate a batch of synthetic process sets as arrays.
+
+    Arrivals follow a Poisson process with the given rate, bursts are drawn
+    from the chosen distribution and priorities are uniform over
+    `priority_levels` values. All times are integers, like the values entered
+    in the GUI. The defaults give an offered load (arrival_rate * mean_burst)
+    of 0.75; at 1 or above every trace is overloaded and waiting times only
+    grow with n_processes.
+
+    Bursts are rounded and clamped to at least 1, which biases their mean
+    upwards when mean_burst is small (an exponential mean of 2 comes out at
+    about 2.2); above 5 the bias is within a few percent.
+
+    Args:
+        n_sets: Number of independent process sets in the batch
+        n_processes: Number of processes in each set
+        seed: Seed or numpy Generator for reproducible batches
+        arrival_rate: Mean number of arrivals per time unit
+        mean_burst: Mean of the burst distribution before rounding
+        burst_distribution: One of "exponential", "lognormal" or "uniform"
+        burst_sigma: Shape parameter of the lognormal distribution
+        priority_levels: Number of distinct priority values (0 is highest)
+
+    Returns:
+        Dictionary of integer arrays of shape (n_sets, n_processes) keyed by
+        'pid', 'arrival', 'burst' and 'priority'
+    """
+    if n_sets <= 0 or n_processes <= 0:
+        raise ValueError("n_sets and n_processes must be positive")
+    if arrival_rate <= 0 or mean_burst <= 0:
+        raise ValueError("arrival_rate and mean_burst must be positive")
+
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    shape = (n_sets, n_processes)
+
+    # Inter-arrival gaps are exponential; the first process arrives at time 0
+    gaps = rng.exponential(1.0 / arrival_rate, size=shape)
+    gaps[:, 0] = 0.0
+    arrival = np.floor(np.cumsum(gaps, axis=1)).astype(np.int64)
+
+    if burst_distribution == "exponential":
+        burst = rng.exponential(mean_burst, size=shape)
+    elif burst_distribution == "lognormal":
+        # Pick mu so that the distribution mean equals mean_burst
+        mu = np.log(mean_burst) - burst_sigma ** 2 / 2
+        burst = rng.lognormal(mu, burst_sigma, size=shape)
+    elif burst_distribution == "uniform":
+        burst = rng.uniform(1, 2 * mean_burst - 1, size=shape) if mean_burst > 1 else np.ones(shape)
+    else:
+        raise ValueError(f"unknown burst distribution {burst_distribution!r}, "
+                         f"expected one of {', '.join(BURST_DISTRIBUTIONS)}")
+    burst = np.maximum(1, np.rint(burst)).astype(np.int64)
+
+    priority = rng.integers(0, priority_levels, size=shape, dtype=np.int64)
+    pid = np.broadcast_to(np.arange(1, n_processes + 1, dtype=np.int64), shape).copy()
+
+    return {'pid': pid, 'arrival': arrival, 'burst': burst, 'priority': priority}
+
+
+def batch_to_processes(batch, index):
+    """
+    Convert one process set of a generated batch into the list of process
+    dictionaries expected by the scheduling algorithms.
+    """
+    columns = [batch[field][index].tolist() for field in ('pid', 'arrival', 'burst', 'priority')]
+    return [{'pid': pid, 'arrival': arrival, 'burst': burst, 'priority': priority}
+            for pid, arrival, burst, priority in zip(*columns)]
@@ -0,0 +1,102 @@
+import argparse
+import importlib
+import json
+import time
+
+import numpy as np
+
+from algorithms.validation import validate_schedule, first_divergence
+from algorithms.workload import generate_workload_batch, batch_to_processes
+
+
+def cross_check(reference, candidate, n_traces=100, n_processes=50, seed=0, validate=True,
+                normalize=True, **workload):
+    """
+    Run two scheduling engines on the same randomized traces and compare them.
+
+    Each trace is generated from (seed, trace_index), so a failing trace can
+    be reproduced on its own. Both engines receive their own copy of the
+    processes, since some engines sort their input in place.
+
+    Args:
+        reference: Callable taking a list of processes and returning a schedule
+        candidate: Engine under test, with the same signature
+        n_traces: Number of random traces to check
+        n_processes: Number of processes per trace
+        seed: Base seed for the workload generator
+        validate: Also run validate_schedule on both schedules
+        normalize: Ignore differences in how continuous runs are split
+        **workload: Extra arguments for generate_workload_batch
+
+    Returns:
+        Report dictionary. 'passed' is True when every trace matched;
+        otherwise the report describes the first failing trace with its
+        'trace' index, the 'processes', any 'violations' per engine and the
+        first 'divergence' as (index, expected_segment, actual_segment).
+    """
+    for trace in range(n_traces):
+        rng = np.random.default_rng([seed, trace])
+        processes = batch_to_processes(generate_workload_batch(1, n_processes, seed=rng, **workload), 0)
+
+        expected = reference([p.copy() for p in processes])
+        actual = candidate([p.copy() for p in processes])
+
+        violations = {}
+        if validate:
+            for name, schedule in (('reference', expected), ('candidate', actual)):
+                errors = validate_schedule(schedule, processes)
+                if errors:
+                    violations[name] = errors
+
+        divergence = first_divergence(expected, actual, normalize)
+        if violations or divergence is not None:
+            return {
+                'passed': False,
+                'traces': trace + 1,
+                'trace': trace,
+                'seed': seed,
+                'processes': processes,
+                'violations': violations,
+                'divergence': divergence,
+            }
+
+    return {'passed': True, 'traces': n_traces, 'seed': seed}
+
+
+def load_engine(path, time_quantum=None):
+    """
+    Import an engine given as "module:function", e.g.
+    "algorithms.scheduling:optimized_round_robin". The time quantum is passed
+    as the second positional argument when given, whatever the engine calls it.
+    """
+    module_name, _, function_name = path.partition(":")
+    engine = getattr(importlib.import_module(module_name), function_name)
+    if time_quantum:
+        return lambda processes: engine(processes, time_quantum)
+    return engine
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Differential check of two scheduling engines")
+    parser.add_argument("reference", help="reference engine as module:function")
+    parser.add_argument("candidate", help="engine under test as module:function")
+    parser.add_argument("--quantum", type=int, default=None, help="time quantum for both engines")
+    parser.add_argument("--reference-quantum", type=int, default=None, help="time quantum for the reference only")
+    parser.add_argument("--candidate-quantum", type=int, default=None, help="time quantum for the candidate only")
+    parser.add_argument("--traces", type=int, default=100)
+    parser.add_argument("--processes", type=int, default=50, help="processes per trace")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-validate", action="store_true")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    reference = load_engine(args.reference, args.reference_quantum or args.quantum)
+    candidate = load_engine(args.candidate, args.candidate_quantum or args.quantum)
+    report = cross_check(reference, candidate,
+                         n_traces=args.traces, n_processes=args.processes, seed=args.seed,
+                         validate=not args.no_validate)
+    report['seconds'] = round(time.perf_counter() - started, 3)
+    if not report['passed'] and len(report['processes']) > 20:
+        report['processes'] = f"{len(report['processes'])} processes, regenerate with seed {args.seed}, trace {report['trace']}"
+    print(json.dumps(report, indent=2))
+    raise SystemExit(0 if report['passed'] else 1)
@@ -0,0 +1,212 @@
+import argparse
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from statistics import NormalDist
+
+import numpy as np
+
+from algorithms.workload import BURST_DISTRIBUTIONS, generate_workload_batch, batch_to_processes
+from controllers.scheduler import ALGORITHMS, run_scheduling_algorithm
+
+METRIC_KEYS = ('avg_waiting_time', 'avg_turnaround_time', 'cpu_utilization', 'throughput')
+
+
+def run_replication_batch(algorithm, n_processes, time_quantum, seed, batch_index, batch_size, workload):
+    """
+    Generate one batch of process sets and schedule each of them.
+
+    The batch is seeded from (seed, batch_index) so results do not depend on
+    how batches are spread across worker processes.
+
+    Returns:
+        Array of shape (batch_size, len(METRIC_KEYS)) with the summary
+        metrics of every replication, in METRIC_KEYS order
+    """
+    rng = np.random.default_rng([seed, batch_index])
+    batch = generate_workload_batch(batch_size, n_processes, seed=rng, **workload)
+
+    results = np.empty((batch_size, len(METRIC_KEYS)))
+    for i in range(batch_size):
+        _, summary_metrics, _ = run_scheduling_algorithm(algorithm, batch_to_processes(batch, i), time_quantum)
+        results[i] = [summary_metrics[key] for key in METRIC_KEYS]
+    return results
+
+
+def _combine(count, mean, m2, samples):
+    """Merge a block of samples into running count/mean/M2 (Chan et al.)."""
+    n = samples.shape[0]
+    block_mean = samples.mean(axis=0)
+    block_m2 = ((samples - block_mean) ** 2).sum(axis=0)
+    total = count + n
+    delta = block_mean - mean
+    mean = mean + delta * n / total
+    m2 = m2 + block_m2 + delta ** 2 * count * n / total
+    return total, mean, m2
+
+
+def confidence_intervals(count, mean, m2, confidence=0.95):
+    """
+    Build normal-approximation confidence intervals from running moments.
+
+    Returns:
+        Dictionary mapping each metric to its mean, std, half_width,
+        ci_low and ci_high
+    """
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    std = np.sqrt(m2 / (count - 1)) if count > 1 else np.zeros_like(mean)
+    half_width = z * std / np.sqrt(count)
+    return {
+        key: {
+            'mean': float(mean[i]),
+            'std': float(std[i]),
+            'half_width': float(half_width[i]),
+            'ci_low': float(mean[i] - half_width[i]),
+            'ci_high': float(mean[i] + half_width[i]),
+        }
+        for i, key in enumerate(METRIC_KEYS)
+    }
+
+
+def _converged(mean, half_width, target_width):
+    # Full interval width relative to the mean; metrics that are exactly zero
+    # with no spread (e.g. waiting time on an idle system) count as converged
+    width = 2 * half_width
+    scale = np.abs(mean)
+    return bool(np.all((width == 0) | ((scale > 0) & (width <= target_width * scale))))
+
+
+def estimate_policy(algorithm, n_processes=20, time_quantum=None, confidence=0.95, target_width=0.05,
+                    min_replications=200, max_replications=10000, batch_size=100, workers=None,
+                    seed=0, **workload):
+    """
+    Estimate the performance of a scheduling policy by Monte Carlo simulation.
+
+    Batches of synthetic workloads are scheduled in parallel across cores and
+    their summary metrics reduced into running means and variances. A fixed
+    number of batches is kept in flight; finished batches are merged in index
+    order and the confidence intervals are checked after every merge, so the
+    run stops as soon as every interval is narrower than `target_width`
+    times its mean.
+
+    Args:
+        algorithm: Name of the scheduling algorithm, one of ALGORITHMS
+        n_processes: Number of processes per generated workload
+        time_quantum: Integer for Round Robin algorithm (default=None)
+        confidence: Confidence level of the intervals
+        target_width: Relative interval width at which to stop, or None to
+            always run max_replications
+        min_replications: Replications to run before checking for convergence
+            (at least 2, so the intervals have a variance estimate)
+        max_replications: Upper bound on the number of replications
+        batch_size: Workloads generated and scheduled per task
+        workers: Number of worker processes (1 runs everything in-process)
+        seed: Base seed for the workload generator
+        **workload: Extra arguments for generate_workload_batch
+
+    Returns:
+        Dictionary with the per-metric intervals under 'metrics', the number
+        of 'replications' run and whether the target width was 'converged'
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"unknown algorithm {algorithm!r}, expected one of {', '.join(ALGORITHMS)}")
+    if max_replications <= 0 or batch_size <= 0:
+        raise ValueError("max_replications and batch_size must be positive")
+    if min_replications < 2:
+        raise ValueError("min_replications must be at least 2")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if target_width is not None and target_width <= 0:
+        raise ValueError("target_width must be positive")
+    if workload.get('burst_distribution', "exponential") not in BURST_DISTRIBUTIONS:
+        raise ValueError(f"unknown burst distribution {workload['burst_distribution']!r}, "
+                         f"expected one of {', '.join(BURST_DISTRIBUTIONS)}")
+
+    batch_size = min(batch_size, max_replications)
+    n_batches = -(-max_replications // batch_size)
+
+    count = 0
+    mean = np.zeros(len(METRIC_KEYS))
+    m2 = np.zeros(len(METRIC_KEYS))
+    converged = False
+
+    def batch_args(index):
+        size = min(batch_size, max_replications - index * batch_size)
+        return algorithm, n_processes, time_quantum, seed, index, size, workload
+
+    def merge(samples):
+        # Merging in batch order keeps the estimate and the stopping point
+        # identical for any worker count
+        nonlocal count, mean, m2
+        count, mean, m2 = _combine(count, mean, m2, samples)
+        if target_width is None or count < min_replications:
+            return False
+        intervals = confidence_intervals(count, mean, m2, confidence)
+        half_width = np.array([intervals[key]['half_width'] for key in METRIC_KEYS])
+        return _converged(mean, half_width, target_width)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for index in range(n_batches):
+            if merge(run_replication_batch(*batch_args(index))):
+                converged = True
+                break
+    else:
+        # Finished batches wait in `done` until every earlier batch has been
+        # merged; the look-ahead bounds how far submission runs ahead of that
+        lookahead = 4 * workers
+        executor = ProcessPoolExecutor(max_workers=workers)
+        running, done = {}, {}
+        next_submit = next_merge = 0
+        try:
+            while next_merge < n_batches:
+                while (len(running) < workers and next_submit < n_batches
+                       and next_submit < next_merge + lookahead):
+                    running[executor.submit(run_replication_batch, *batch_args(next_submit))] = next_submit
+                    next_submit += 1
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done[running.pop(future)] = future.result()
+
+                while next_merge in done:
+                    if merge(done.pop(next_merge)):
+                        converged = True
+                        break
+                    next_merge += 1
+                if converged:
+                    break
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    return {
+        'algorithm': algorithm,
+        'replications': count,
+        'converged': converged,
+        'metrics': confidence_intervals(count, mean, m2, confidence),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo estimate of scheduling policy metrics")
+    parser.add_argument("algorithm", choices=ALGORITHMS)
+    parser.add_argument("--processes", type=int, default=20, help="processes per workload")
+    parser.add_argument("--quantum", type=int, default=None)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--target-width", type=float, default=0.05, help="relative CI width to stop at")
+    parser.add_argument("--min-replications", type=int, default=200)
+    parser.add_argument("--max-replications", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=100, help="workloads per worker task")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--arrival-rate", type=float, default=0.15)
+    parser.add_argument("--mean-burst", type=float, default=5.0)
+    parser.add_argument("--burst-distribution", default="exponential", choices=BURST_DISTRIBUTIONS)
+    args = parser.parse_args()
+
+    result = estimate_policy(args.algorithm, args.processes, args.quantum, args.confidence, args.target_width,
+                             min_replications=args.min_replications, max_replications=args.max_replications,
+                             batch_size=args.batch_size, workers=args.workers, seed=args.seed,
+                             arrival_rate=args.arrival_rate, mean_burst=args.mean_burst,
+                             burst_distribution=args.burst_distribution)
+    print(json.dumps(result, indent=2))
@@ -1,6 +1,8 @@
 from algorithms.scheduling import fcfs, optimized_sjf, srtf, optimized_round_robin, priority_scheduling
 from algorithms.metrics import calculate_metrics
 
+ALGORITHMS = ("FCFS", "SJF", "SRTF", "Round Robin", "Priority")
+
 def run_scheduling_algorithm(algorithm, processes, time_quantum=None):
     """
     Run the selected scheduling algorithm and return the schedule and metrics.
@@ -0,0 +1,370 @@
+import argparse
+import asyncio
+import csv
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+
+from controllers.scheduler import ALGORITHMS, run_scheduling_algorithm
+
+PROCESS_FIELDS = ("pid", "arrival", "burst", "priority")
+
+MAX_BODY_SIZE = 64 * 1024 * 1024
+MAX_VALUE = 10 ** 9
+
+# Largest trace accepted per algorithm. SRTF and Priority scan every process
+# at each step and Round Robin pops from the front of a list, so they are
+# quadratic; the limits keep a single job to roughly a second of CPU time.
+MAX_PROCESSES = {
+    "FCFS": 200000,
+    "SJF": 200000,
+    "SRTF": 2000,
+    "Round Robin": 20000,
+    "Priority": 2000,
+}
+STREAM_CHUNK = 512
+
+
+class RequestError(Exception):
+    """Raised when a client request cannot be turned into a scheduling job."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def parse_int(value):
+    """
+    Parse a non-negative integer field from JSON or CSV input.
+
+    Accepts ints, integral floats and strings of ASCII digits; booleans,
+    fractional numbers and anything above MAX_VALUE are rejected rather than
+    truncated, so the scheduled values are always the ones the client sent.
+    """
+    if isinstance(value, bool):
+        raise ValueError(value)
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(value)
+        value = int(value)
+    elif isinstance(value, str):
+        value = value.strip()
+        if not (value.isascii() and value.isdigit()):
+            raise ValueError(value)
+        value = int(value)
+    elif not isinstance(value, int):
+        raise ValueError(value)
+    if not 0 <= value <= MAX_VALUE:
+        raise ValueError(value)
+    return value
+
+
+def parse_processes(rows, max_processes=None):
+    """
+    Validate a list of process records coming from a client.
+
+    Args:
+        rows: List of dictionaries with pid, arrival, burst and priority
+        max_processes: Reject longer lists with a 413 (None for no limit)
+
+    Returns:
+        List of process dictionaries with integer fields
+    """
+    if max_processes is not None and len(rows) > max_processes:
+        raise RequestError(413, f"at most {max_processes} processes are accepted for this algorithm")
+    processes = []
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            raise RequestError(400, f"process {index} must be an object")
+        try:
+            process = {field: parse_int(row.get(field, 0 if field == 'priority' else None))
+                       for field in PROCESS_FIELDS}
+        except ValueError:
+            raise RequestError(400, f"process {index} needs integer {', '.join(PROCESS_FIELDS)} "
+                                    f"between 0 and {MAX_VALUE}")
+        if process['burst'] == 0:
+            raise RequestError(400, f"process {index} needs burst > 0")
+        processes.append(process)
+
+    if not processes:
+        raise RequestError(400, "at least one process is required")
+    if len({p['pid'] for p in processes}) != len(processes):
+        raise RequestError(400, "process ids must be unique")
+    return processes
+
+
+def parse_csv_upload(text, max_processes=None):
+    """
+    Read an uploaded trace in CSV form (pid, arrival, burst[, priority]).
+    A header row starting with "pid" is optional and skipped when present;
+    every other row must be a valid process.
+    """
+    rows = []
+    for line, record in enumerate(csv.reader(io.StringIO(text)), start=1):
+        if not record or not "".join(record).strip():
+            continue
+        if not rows and record[0].strip().lower() == "pid":
+            continue  # Header row
+        if len(record) > len(PROCESS_FIELDS):
+            raise RequestError(400, f"line {line} has {len(record)} columns, expected at most {len(PROCESS_FIELDS)}")
+        if max_processes is not None and len(rows) >= max_processes:
+            raise RequestError(413, f"at most {max_processes} processes are accepted for this algorithm")
+        rows.append(dict(zip(PROCESS_FIELDS, (value.strip() for value in record))))
+    return parse_processes(rows)
+
+
+def normalize_job(algorithm, processes, time_quantum=None):
+    """
+    Bring a job into its canonical form so identical requests compare equal.
+    The quantum only matters for Round Robin and defaults the same way the
+    controller does.
+    """
+    if algorithm not in ALGORITHMS:
+        raise RequestError(400, f"unknown algorithm {algorithm!r}, expected one of {', '.join(ALGORITHMS)}")
+    if algorithm == "Round Robin":
+        if time_quantum is None or time_quantum == "":
+            time_quantum = 2
+        else:
+            try:
+                time_quantum = parse_int(time_quantum)
+            except ValueError:
+                time_quantum = 0
+            if time_quantum <= 0:
+                raise RequestError(400, f"time_quantum must be an integer between 1 and {MAX_VALUE}")
+    else:
+        time_quantum = None
+    return algorithm, processes, time_quantum
+
+
+def job_key(algorithm, processes, time_quantum):
+    """Return a stable digest identifying a normalized job."""
+    payload = json.dumps([algorithm, time_quantum, [[p[f] for f in PROCESS_FIELDS] for p in processes]],
+                         separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SchedulerService:
+    """
+    Runs scheduling jobs on a bounded process pool.
+
+    At most `max_workers` jobs run at once and at most `max_pending` distinct
+    jobs may be queued or running; identical jobs submitted while one is
+    already in flight share its result instead of being computed again.
+    """
+
+    def __init__(self, max_workers=None, max_pending=64):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        # Workers are spawned rather than forked so they never inherit open
+        # client sockets, which would keep connections alive after close()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                             mp_context=multiprocessing.get_context("spawn"))
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._inflight = {}
+
+    @property
+    def pending(self):
+        return len(self._inflight)
+
+    async def submit(self, algorithm, processes, time_quantum=None):
+        """
+        Schedule a job, or join the identical one already in flight.
+
+        Returns:
+            schedule, summary_metrics, detailed_metrics as from run_scheduling_algorithm
+        """
+        key = job_key(algorithm, processes, time_quantum)
+        task = self._inflight.get(key)
+        if task is None:
+            if len(self._inflight) >= self.max_pending:
+                raise RequestError(503, "job queue is full, retry later")
+            task = asyncio.ensure_future(self._run(algorithm, processes, time_quantum))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one client disconnecting does not cancel the shared job
+        return await asyncio.shield(task)
+
+    async def _run(self, algorithm, processes, time_quantum):
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, run_scheduling_algorithm, algorithm, processes, time_quantum
+            )
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_result_lines(schedule, summary_metrics, detailed_metrics):
+    """Yield the NDJSON records describing a finished job."""
+    for pid, start, end in schedule:
+        yield {'type': 'segment', 'pid': pid, 'start': start, 'end': end}
+    for process in detailed_metrics or []:
+        yield dict(process, type='process')
+    yield dict(summary_metrics or {}, type='summary')
+
+
+class SchedulerHTTPServer:
+    """
+    Minimal HTTP/1.1 front end for SchedulerService.
+
+    Routes:
+        GET  /health            - liveness and queue depth
+        POST /schedule          - JSON body {algorithm, processes, time_quantum}
+        POST /schedule/upload   - CSV trace body, ?algorithm=...&time_quantum=...
+
+    Results are streamed as NDJSON: one line per segment, one per process,
+    then a summary line. The connection is closed after each response.
+    """
+
+    def __init__(self, service):
+        self.service = service
+
+    async def handle(self, reader, writer):
+        head_sent = False
+        try:
+            method, target, headers, body = await self._read_request(reader)
+            path = urlsplit(target).path
+            query = {k: v[-1] for k, v in parse_qs(urlsplit(target).query).items()}
+
+            if method == "GET" and path == "/health":
+                await self._send_json(writer, 200, {'status': 'ok', 'pending': self.service.pending})
+                return
+            elif method == "POST" and path == "/schedule":
+                try:
+                    payload = json.loads(body or b"{}")
+                except ValueError:
+                    raise RequestError(400, "body must be valid JSON")
+                if not isinstance(payload, dict) or not isinstance(payload.get('processes'), list):
+                    raise RequestError(400, "body must be an object with a 'processes' list")
+                algorithm = payload.get('algorithm', "FCFS")
+                processes = parse_processes(payload['processes'], MAX_PROCESSES.get(algorithm))
+                job = normalize_job(algorithm, processes, payload.get('time_quantum'))
+            elif method == "POST" and path == "/schedule/upload":
+                try:
+                    text = body.decode()
+                except UnicodeDecodeError:
+                    raise RequestError(400, "upload must be UTF-8 text")
+                algorithm = query.get('algorithm', "FCFS")
+                processes = parse_csv_upload(text, MAX_PROCESSES.get(algorithm))
+                job = normalize_job(algorithm, processes, query.get('time_quantum'))
+            else:
+                raise RequestError(404, f"no route for {method} {path}")
+
+            result = await self.service.submit(*job)
+            head_sent = True
+            await self._stream_result(writer, *result)
+        except RequestError as e:
+            await self._send_error(writer, e.status, e.message)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            # Once the 200 head is out the only thing left to do is drop the connection
+            if not head_sent:
+                await self._send_error(writer, 500, f"scheduling failed: {e}")
+        finally:
+            writer.close()
+
+    async def _send_error(self, writer, status, message):
+        try:
+            await self._send_json(writer, status, {'error': message})
+        except ConnectionError:
+            pass  # The client has already gone away
+
+    @staticmethod
+    async def _read_line(reader):
+        try:
+            return (await reader.readline()).decode('latin-1').strip()
+        except (asyncio.LimitOverrunError, ValueError):
+            # readline raises ValueError once a line exceeds the stream limit
+            raise RequestError(431, "request line or header too large")
+
+    async def _read_request(self, reader):
+        request_line = await self._read_line(reader)
+        try:
+            method, target, _ = request_line.split(" ", 2)
+        except ValueError:
+            raise RequestError(400, "malformed request line")
+
+        headers = {}
+        while True:
+            line = await self._read_line(reader)
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if 'transfer-encoding' in headers:
+            raise RequestError(501, "Transfer-Encoding is not supported, send a Content-Length")
+        if method.upper() == "POST" and 'content-length' not in headers:
+            raise RequestError(411, "Content-Length is required")
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise RequestError(400, "invalid Content-Length")
+        if length < 0:
+            raise RequestError(400, "invalid Content-Length")
+        if length > MAX_BODY_SIZE:
+            raise RequestError(413, "request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target, headers, body
+
+    async def _stream_result(self, writer, schedule, summary_metrics, detailed_metrics):
+        self._write_head(writer, 200, "application/x-ndjson")
+        chunk = []
+        for record in iter_result_lines(schedule, summary_metrics, detailed_metrics):
+            chunk.append(json.dumps(record))
+            if len(chunk) >= STREAM_CHUNK:
+                writer.write(("\n".join(chunk) + "\n").encode())
+                await writer.drain()
+                chunk = []
+        if chunk:
+            writer.write(("\n".join(chunk) + "\n").encode())
+        await writer.drain()
+
+    async def _send_json(self, writer, status, payload):
+        body = (json.dumps(payload) + "\n").encode()
+        self._write_head(writer, status, "application/json", len(body))
+        writer.write(body)
+        await writer.drain()
+
+    @staticmethod
+    def _write_head(writer, status, content_type, length=None):
+        reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 411: "Length Required",
+                   413: "Payload Too Large", 431: "Request Header Fields Too Large", 500: "Internal Server Error", 501: "Not Implemented",
+                   503: "Service Unavailable"}
+        lines = [f"HTTP/1.1 {status} {reasons.get(status, '')}",
+                 f"Content-Type: {content_type}",
+                 "Connection: close"]
+        if length is not None:
+            lines.append(f"Content-Length: {length}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1'))
+
+
+async def serve(host="127.0.0.1", port=8765, max_workers=None, max_pending=64):
+    """Start the scheduling service and run until cancelled."""
+    service = SchedulerService(max_workers=max_workers, max_pending=max_pending)
+    server = await asyncio.start_server(SchedulerHTTPServer(service).handle, host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local CPU scheduling service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None, help="size of the process pool")
+    parser.add_argument("--max-pending", type=int, default=64, help="distinct jobs allowed in flight")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_pending))
+    except KeyboardInterrupt:
+        pass
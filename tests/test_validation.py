@@ -0,0 +1,89 @@
+from algorithms.scheduling import fcfs, optimized_sjf, srtf
+from algorithms.validation import validate_schedule, normalize_schedule, first_divergence
+from controllers.differential import cross_check
+
+PROCESSES = [
+    {'pid': 1, 'arrival': 0, 'burst': 5, 'priority': 0},
+    {'pid': 2, 'arrival': 2, 'burst': 3, 'priority': 0},
+]
+
+
+def test_valid_schedule():
+    assert validate_schedule([(1, 0, 5), (2, 5, 8)], PROCESSES) == []
+
+
+def test_valid_schedule_out_of_order():
+    assert validate_schedule([(2, 5, 8), (1, 0, 5)], PROCESSES) == []
+
+
+def test_overlap():
+    errors = validate_schedule([(1, 0, 5), (2, 4, 7)], PROCESSES)
+    assert errors == ["segment 1: pid 2 starts at 4 while the CPU is busy until 5"]
+
+
+def test_overlap_out_of_order_keeps_original_index():
+    errors = validate_schedule([(2, 4, 7), (1, 0, 5)], PROCESSES)
+    assert errors == ["segment 0: pid 2 starts at 4 while the CPU is busy until 5"]
+
+
+def test_run_before_arrival():
+    errors = validate_schedule([(2, 0, 3), (1, 3, 8)], PROCESSES)
+    assert errors == ["segment 0: pid 2 runs at 0 before arriving at 2"]
+
+
+def test_burst_total():
+    errors = validate_schedule([(1, 0, 4), (2, 4, 7)], PROCESSES)
+    assert errors == ["pid 1: ran for 4 but burst is 5"]
+
+
+def test_missing_process():
+    errors = validate_schedule([(1, 0, 5)], PROCESSES)
+    assert errors == ["pid 2: ran for 0 but burst is 3"]
+
+
+def test_negative_segment():
+    errors = validate_schedule([(1, 5, 0), (1, 5, 15), (2, 15, 18)], PROCESSES)
+    assert errors[0] == "segment 0: pid 1 ends at 0 before it starts at 5"
+
+
+def test_unknown_pid():
+    errors = validate_schedule([(1, 0, 5), (3, 5, 6), (2, 6, 9)], PROCESSES)
+    assert errors == ["segment 1: unknown pid 3"]
+
+
+def test_duplicate_pids():
+    processes = PROCESSES + [{'pid': 1, 'arrival': 0, 'burst': 3, 'priority': 0}]
+    assert validate_schedule([(1, 0, 5), (2, 5, 8)], processes) == ["duplicate pid 1 in processes"]
+
+
+def test_max_errors():
+    schedule = [(1, 0, 1)] * 20
+    assert len(validate_schedule(schedule, PROCESSES, max_errors=3)) == 3
+
+
+def test_engines_produce_valid_schedules():
+    processes = PROCESSES + [{'pid': 3, 'arrival': 3, 'burst': 1, 'priority': 0}]
+    for engine in (fcfs, optimized_sjf, srtf):
+        assert validate_schedule(engine([p.copy() for p in processes]), processes) == []
+
+
+def test_normalize_merges_contiguous_runs():
+    assert normalize_schedule([(1, 0, 2), (1, 2, 5), (2, 5, 5), (2, 5, 8)]) == [(1, 0, 5), (2, 5, 8)]
+
+
+def test_first_divergence():
+    assert first_divergence([(1, 0, 2), (1, 2, 5)], [(1, 0, 5)]) is None
+    assert first_divergence([(1, 0, 5), (2, 5, 8)], [(1, 0, 5), (2, 5, 9)]) == (1, (2, 5, 8), (2, 5, 9))
+    assert first_divergence([(1, 0, 5), (2, 5, 8)], [(1, 0, 5)]) == (1, (2, 5, 8), None)
+
+
+def test_cross_check_same_engine_passes():
+    assert cross_check(srtf, srtf, n_traces=10, n_processes=30)['passed']
+
+
+def test_cross_check_reports_known_divergence():
+    report = cross_check(fcfs, optimized_sjf, seed=0)
+    assert not report['passed']
+    assert report['trace'] == 0
+    assert report['violations'] == {}
+    assert report['divergence'][0] == 20